@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Parallel source fetcher with a shared on-disk cache for blog-trend-researcher.
+
+Fetches research URLs concurrently (with a per-host rate limit), extracts
+title, publication date and key points, and emits entries in the
+research-findings.json `sources[]` format. Responses are cached on disk
+across projects: fresh entries are served directly, stale entries are
+revalidated with ETag/Last-Modified, and the cache is evicted
+least-recently-used once it exceeds its size budget.
+
+Usage:
+    python fetch_sources.py URL [URL ...] --output sources.json
+    python fetch_sources.py --input research-findings.json --output sources.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+DEFAULT_CACHE_DIR = REPO_ROOT / "blog-workspace" / ".source-cache"
+DEFAULT_TTL = 7 * 24 * 3600
+DEFAULT_MAX_CACHE_MB = 200
+USER_AGENT = "blog-trend-researcher/1.0 (+source fetcher)"
+ALLOWED_SCHEMES = ("http", "https")
+
+MAX_KEY_POINTS = 5
+MIN_KEY_POINT_CHARS = 60
+DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+DATE_META = {
+    "article:published_time", "og:published_time", "datepublished",
+    "date", "pubdate", "publish-date", "dc.date", "citation_publication_date",
+}
+
+
+class FetchCache:
+    """Size-bounded on-disk HTTP cache keyed on URL."""
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR, ttl: int = DEFAULT_TTL,
+                 max_bytes: int = DEFAULT_MAX_CACHE_MB * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _paths(self, url: str) -> Tuple[Path, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def get(self, url: str) -> Optional[Tuple[Dict, bytes]]:
+        """Return (meta, body) for a cached URL, marking it recently used."""
+        meta_file, body_file = self._paths(url)
+        try:
+            with open(meta_file, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            body = body_file.read_bytes()
+            # Access time drives LRU eviction; another worker may have just evicted it
+            os.utime(meta_file)
+        except (OSError, ValueError):
+            return None
+        return meta, body
+
+    def is_fresh(self, meta: Dict) -> bool:
+        return time.time() - meta.get("fetchedAt", 0) < self.ttl
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes):
+        # Unique tmp name so concurrent writers never share a partial file
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    def put(self, url: str, meta: Dict, body: bytes):
+        meta_file, body_file = self._paths(url)
+        meta = dict(meta, url=url, fetchedAt=time.time(), size=len(body))
+        self._write_atomic(body_file, body)
+        self._write_atomic(meta_file, json.dumps(meta).encode("utf-8"))
+        self.evict()
+
+    def touch(self, url: str, meta: Dict, headers: Optional[Dict] = None):
+        """Refresh the TTL of an entry revalidated with a 304, keeping any new validators."""
+        meta_file, _ = self._paths(url)
+        meta = dict(meta, fetchedAt=time.time())
+        for header, key in (("ETag", "etag"), ("Last-Modified", "lastModified")):
+            if headers and headers.get(header):
+                meta[key] = headers.get(header)
+        self._write_atomic(meta_file, json.dumps(meta).encode("utf-8"))
+
+    def evict(self):
+        """Drop least-recently-used entries until the cache fits max_bytes."""
+        with self._lock:
+            entries = []
+            total = 0
+            for meta_file in self.cache_dir.glob("*.json"):
+                body_file = meta_file.with_suffix(".body")
+                try:
+                    size = meta_file.stat().st_size + body_file.stat().st_size
+                    accessed = meta_file.stat().st_mtime
+                except OSError:
+                    continue
+                entries.append((accessed, size, meta_file, body_file))
+                total += size
+            for _, size, meta_file, body_file in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                for path in (meta_file, body_file):
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+                total -= size
+
+
+class HostRateLimiter:
+    """Enforce a minimum interval between requests to the same host."""
+
+    def __init__(self, min_interval: float = 1.0):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+
+    def wait(self, host: str):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class PageExtractor(HTMLParser):
+    """Pull title, publication date and paragraph text out of an HTML page."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = ""
+        self.og_title = ""
+        self.description = ""
+        self.date = ""
+        self.paragraphs: List[str] = []
+        self._in_title = False
+        self._in_paragraph = False
+        self._skip_depth = 0
+        self._buffer: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag in ("script", "style", "nav", "footer", "header"):
+            self._skip_depth += 1
+        elif tag == "title":
+            self._in_title = True
+        elif tag == "p" and not self._skip_depth:
+            self._in_paragraph = True
+            self._buffer = []
+        elif tag == "meta":
+            name = (attrs.get("property") or attrs.get("name") or attrs.get("itemprop") or "").lower()
+            content = attrs.get("content") or ""
+            if name == "og:title":
+                self.og_title = content
+            elif name in ("description", "og:description") and not self.description:
+                self.description = content
+            elif name in DATE_META and not self.date:
+                self.date = content
+        elif tag == "time" and not self.date and attrs.get("datetime"):
+            self.date = attrs["datetime"]
+
+    def handle_endtag(self, tag):
+        if tag in ("script", "style", "nav", "footer", "header") and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag == "title":
+            self._in_title = False
+        elif tag == "p" and self._in_paragraph:
+            self._in_paragraph = False
+            text = " ".join("".join(self._buffer).split())
+            if text:
+                self.paragraphs.append(text)
+
+    def handle_data(self, data):
+        if self._in_title:
+            self.title += data
+        elif self._in_paragraph and not self._skip_depth:
+            self._buffer.append(data)
+
+
+def classify_source(url: str) -> Tuple[str, str]:
+    """Guess (type, credibility) for a source from its URL."""
+    parsed = urlparse(url)
+    host, path = parsed.netloc.lower(), parsed.path.lower()
+    if "arxiv.org" in host or host.endswith(".edu") or "/papers/" in path:
+        return "research", "High"
+    if host.startswith(("docs.", "developers.")) or "/docs" in path or host == "github.com":
+        return "documentation", "High"
+    if any(site in host for site in ("reddit.com", "stackoverflow.com", "news.ycombinator.com")):
+        return "forum", "Medium"
+    return "article", "Medium"
+
+
+def extract_source(url: str, body: bytes, content_type: str) -> Dict:
+    """Build a research-findings.json `sources[]` entry from a fetched page."""
+    charset = "utf-8"
+    match = re.search(r"charset=([\w-]+)", content_type or "")
+    if match:
+        charset = match.group(1)
+    text = body.decode(charset, errors="replace")
+
+    extractor = PageExtractor()
+    if "html" in (content_type or "html"):
+        extractor.feed(text)
+        paragraphs = extractor.paragraphs
+    else:
+        paragraphs = [" ".join(block.split()) for block in text.split("\n\n") if block.strip()]
+
+    key_points = []
+    if extractor.description:
+        key_points.append(extractor.description.strip())
+    for paragraph in paragraphs:
+        if len(key_points) >= MAX_KEY_POINTS:
+            break
+        sentence = SENTENCE_RE.split(paragraph)[0]
+        if len(sentence) >= MIN_KEY_POINT_CHARS and sentence not in key_points:
+            key_points.append(sentence)
+
+    source_type, credibility = classify_source(url)
+    date_match = DATE_RE.search(extractor.date)
+    entry = {
+        "title": (extractor.og_title or extractor.title or url).strip(),
+        "url": url,
+        "type": source_type,
+        "credibility": credibility,
+        "keyPoints": key_points,
+        "dateAccessed": datetime.now().strftime("%Y-%m-%d"),
+    }
+    if date_match:
+        entry["datePublished"] = date_match.group(1)
+    return entry
+
+
+class SourceFetcher:
+    """Concurrent, cache-backed fetch stage producing `sources[]` entries."""
+
+    def __init__(self, cache: Optional[FetchCache] = None, workers: int = 8,
+                 per_host_interval: float = 1.0, timeout: float = 20.0):
+        self.cache = cache
+        self.workers = workers
+        self.timeout = timeout
+        self.limiter = HostRateLimiter(per_host_interval)
+        self.stats = {"hit": 0, "revalidated": 0, "miss": 0, "error": 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, outcome: str):
+        with self._stats_lock:
+            self.stats[outcome] += 1
+
+    def fetch(self, url: str) -> Tuple[bytes, str]:
+        """Return (body, content type) for a URL, using the cache when possible."""
+        scheme = urlparse(url).scheme.lower()
+        if scheme not in ALLOWED_SCHEMES:
+            raise ValueError(f"unsupported URL scheme {scheme or '(none)'!r}")
+        cached = self.cache.get(url) if self.cache else None
+        if cached and self.cache.is_fresh(cached[0]):
+            self._count("hit")
+            return cached[1], cached[0].get("contentType", "")
+
+        request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+        if cached:
+            meta = cached[0]
+            if meta.get("etag"):
+                request.add_header("If-None-Match", meta["etag"])
+            if meta.get("lastModified"):
+                request.add_header("If-Modified-Since", meta["lastModified"])
+
+        self.limiter.wait(urlparse(url).netloc)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                body = response.read()
+                meta = {
+                    "etag": response.headers.get("ETag"),
+                    "lastModified": response.headers.get("Last-Modified"),
+                    "contentType": response.headers.get("Content-Type", ""),
+                }
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and cached:
+                self.cache.touch(url, cached[0], e.headers)
+                self._count("revalidated")
+                return cached[1], cached[0].get("contentType", "")
+            raise
+
+        if self.cache:
+            self.cache.put(url, meta, body)
+        self._count("miss")
+        return body, meta["contentType"]
+
+    def _fetch_source(self, url: str) -> Optional[Dict]:
+        try:
+            body, content_type = self.fetch(url)
+            return extract_source(url, body, content_type)
+        except Exception as e:
+            self._count("error")
+            print(f"⚠️  Failed to fetch {url}: {e}", file=sys.stderr)
+            return None
+
+    def fetch_sources(self, urls: List[str]) -> List[Dict]:
+        """Fetch URLs in parallel and return sources in input order."""
+        unique_urls = list(dict.fromkeys(urls))
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            results = list(pool.map(self._fetch_source, unique_urls))
+        sources = [source for source in results if source]
+        return [{"id": f"source-{index:03d}", **source} for index, source in enumerate(sources, 1)]
+
+
+def load_urls(input_file: Path) -> List[str]:
+    """Read URLs from a text file (one per line) or an existing research JSON file."""
+    if input_file.suffix == ".json":
+        with open(input_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        sources = data.get("sources", data) if isinstance(data, dict) else data
+        return [source["url"] for source in sources if isinstance(source, dict)
+                and str(source.get("url", "")).startswith(("http://", "https://"))]
+    with open(input_file, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fetch research sources in parallel with a shared cache")
+    parser.add_argument("urls", nargs="*", help="URLs to fetch")
+    parser.add_argument("--input", help="Text file of URLs or research JSON with sources[]")
+    parser.add_argument("--output", help="Write sources JSON here (default: stdout)")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent fetches")
+    parser.add_argument("--per-host-interval", type=float, default=1.0, help="Seconds between requests to one host")
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR), help="Shared cache directory")
+    parser.add_argument("--ttl", type=int, default=DEFAULT_TTL, help="Seconds before revalidating a cached page")
+    parser.add_argument("--max-cache-mb", type=int, default=DEFAULT_MAX_CACHE_MB, help="Cache size budget")
+    parser.add_argument("--no-cache", action="store_true", help="Always fetch from the network")
+    args = parser.parse_args()
+
+    urls = list(args.urls)
+    if args.input:
+        urls.extend(load_urls(Path(args.input)))
+    if not urls:
+        parser.error("provide URLs or --input")
+
+    cache = None if args.no_cache else FetchCache(Path(args.cache_dir), args.ttl, args.max_cache_mb * 1024 * 1024)
+    fetcher = SourceFetcher(cache, args.workers, args.per_host_interval)
+    sources = fetcher.fetch_sources(urls)
+
+    output = json.dumps({"sources": sources, "totalSources": len(sources)}, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        print(output)
+
+    stats = fetcher.stats
+    print(f"✅ {len(sources)} sources ({stats['hit']} cached, {stats['revalidated']} revalidated, "
+          f"{stats['miss']} fetched, {stats['error']} failed)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""Tests for fetch_sources.py against a local fixture HTTP server."""
+
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import fetch_sources
+from fetch_sources import FetchCache, HostRateLimiter, SourceFetcher
+
+PAGE = b"""<html><head><title>Fixture Page</title>
+<meta name="description" content="A fixture page describing LangGraph agents.">
+<meta property="article:published_time" content="2025-11-03T10:00:00Z"></head>
+<body><nav><p>Navigation text that is long enough to look like a real key point here.</p></nav>
+<p>LangGraph lets you build stateful multi-actor applications with LLMs using a graph of nodes. More.</p>
+</body></html>"""
+ETAG = '"v1"'
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requests.append((self.path, time.monotonic(), self.headers.get("If-None-Match")))
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def url(server, path="/page.html"):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def test_miss_then_hit_then_revalidation(server, tmp_path):
+    fetcher = SourceFetcher(FetchCache(tmp_path), per_host_interval=0)
+    first = fetcher.fetch_sources([url(server)])
+    second = fetcher.fetch_sources([url(server)])
+    assert fetcher.stats["miss"] == 1
+    assert fetcher.stats["hit"] == 1
+    assert len(server.requests) == 1
+    assert first == second
+
+    stale = SourceFetcher(FetchCache(tmp_path, ttl=0), per_host_interval=0)
+    third = stale.fetch_sources([url(server)])
+    assert stale.stats["revalidated"] == 1
+    assert server.requests[-1][2] == ETAG
+    assert third[0]["keyPoints"] == first[0]["keyPoints"]
+
+
+def test_extracted_source_fields(server, tmp_path):
+    source = SourceFetcher(FetchCache(tmp_path), per_host_interval=0).fetch_sources([url(server)])[0]
+    assert source["id"] == "source-001"
+    assert source["title"] == "Fixture Page"
+    assert source["datePublished"] == "2025-11-03"
+    assert source["keyPoints"][0] == "A fixture page describing LangGraph agents."
+    # Navigation paragraphs are skipped
+    assert all("Navigation" not in point for point in source["keyPoints"])
+
+
+def test_ttl_expiry(server, tmp_path):
+    cache = FetchCache(tmp_path, ttl=0.3)
+    fetcher = SourceFetcher(cache, per_host_interval=0)
+    fetcher.fetch(url(server))
+    fetcher.fetch(url(server))
+    assert fetcher.stats == {"hit": 1, "revalidated": 0, "miss": 1, "error": 0}
+    time.sleep(0.4)
+    fetcher.fetch(url(server))
+    assert fetcher.stats["revalidated"] == 1
+    # Revalidation refreshed the TTL
+    fetcher.fetch(url(server))
+    assert fetcher.stats["hit"] == 2
+
+
+def test_touch_is_atomic_and_stores_new_validators(tmp_path):
+    cache = FetchCache(tmp_path)
+    cache.put("http://example.test/a", {"etag": '"v1"', "lastModified": None}, b"body")
+    meta, _ = cache.get("http://example.test/a")
+    cache.touch("http://example.test/a", meta, {"ETag": '"v2"', "Last-Modified": "Mon, 03 Nov 2025 10:00:00 GMT"})
+    meta, body = cache.get("http://example.test/a")
+    assert meta["etag"] == '"v2"'
+    assert meta["lastModified"] == "Mon, 03 Nov 2025 10:00:00 GMT"
+    assert body == b"body"
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+
+def test_entry_evicted_during_get_is_a_miss(tmp_path, monkeypatch):
+    cache = FetchCache(tmp_path)
+    cache.put("http://example.test/a", {}, b"body")
+
+    def evicted(path, *args):
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(fetch_sources.os, "utime", evicted)
+    assert cache.get("http://example.test/a") is None
+
+
+@pytest.mark.parametrize("bad_url", ["file:///etc/passwd", "ftp://example.test/a", "example.test/a"])
+def test_non_http_urls_are_rejected_before_cache_and_network(bad_url, tmp_path):
+    cache = FetchCache(tmp_path)
+    cache.put(bad_url, {"contentType": "text/html"}, b"<p>cached</p>")
+    fetcher = SourceFetcher(cache, per_host_interval=0)
+    assert fetcher.fetch_sources([bad_url]) == []
+    assert fetcher.stats == {"hit": 0, "revalidated": 0, "miss": 0, "error": 1}
+
+
+def test_lru_eviction_under_small_budget(tmp_path):
+    body = b"x" * 1000
+    cache = FetchCache(tmp_path, max_bytes=2500)
+    cache.put("http://example.test/a", {}, body)
+    cache.put("http://example.test/b", {}, body)
+    now = time.time()
+    for name, age in (("a", 20), ("b", 10)):
+        meta_file, _ = cache._paths(f"http://example.test/{name}")
+        os.utime(meta_file, (now - age, now - age))
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get("http://example.test/a")
+    cache.put("http://example.test/c", {}, body)
+    assert cache.get("http://example.test/a")
+    assert cache.get("http://example.test/b") is None
+    assert cache.get("http://example.test/c")
+
+
+def test_host_rate_limiter_spaces_same_host():
+    limiter = HostRateLimiter(0.2)
+    times = []
+
+    def hit(host):
+        limiter.wait(host)
+        times.append((host, time.monotonic()))
+
+    threads = [threading.Thread(target=hit, args=("a.test",)) for _ in range(3)]
+    threads.append(threading.Thread(target=hit, args=("b.test",)))
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    same_host = sorted(moment for host, moment in times if host == "a.test")
+    assert all(later - earlier >= 0.18 for earlier, later in zip(same_host, same_host[1:]))
+    other_host = [moment for host, moment in times if host == "b.test"]
+    assert other_host[0] - start < 0.1
+
+
+def test_fetcher_spaces_requests_per_host(server, tmp_path):
+    fetcher = SourceFetcher(FetchCache(tmp_path), workers=4, per_host_interval=0.2)
+    fetcher.fetch_sources([url(server, f"/page-{index}.html") for index in range(3)])
+    moments = sorted(moment for _, moment, _ in server.requests)
+    assert len(moments) == 3
+    assert all(later - earlier >= 0.18 for earlier, later in zip(moments, moments[1:]))
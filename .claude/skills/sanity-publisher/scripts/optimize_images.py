@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Image optimization stage between image_generation and publishing.
+
+Resizes every image declared in image-manifest.json to its manifest
+dimensions, converts it to WebP (and AVIF when Pillow supports it) at a
+set of responsive widths, and records the variants back into the
+manifest. Source hashes are stored alongside the variants so unchanged
+images are skipped on re-runs.
+
+Requires Pillow (pip install Pillow).
+
+Usage:
+    python optimize_images.py blog-workspace/image-manifest.json
+    python optimize_images.py blog-workspace/image-manifest.json --widths 480 800 1200 --formats webp avif
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:
+    Image = None
+
+DEFAULT_WIDTHS = [480, 800, 1200]
+DEFAULT_FORMATS = ["webp", "avif"]
+DEFAULT_QUALITY = {"webp": 82, "avif": 60}
+OUTPUT_DIR = "images/optimized"
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def supported_formats(formats: List[str]) -> List[str]:
+    """Drop formats this Pillow build cannot encode."""
+    available = []
+    for fmt in formats:
+        if fmt == "avif" and not features.check("avif"):
+            print("⚠️  AVIF encoding not available in this Pillow build, skipping AVIF", file=sys.stderr)
+            continue
+        available.append(fmt)
+    return available
+
+
+def manifest_entries(manifest: Dict) -> List[Dict]:
+    """Cover plus section entries that point at an image file."""
+    entries = [manifest["cover"]] if manifest.get("cover") else []
+    entries.extend(manifest.get("sections", []))
+    return [entry for entry in entries if entry.get("path")]
+
+
+def settings_key(entry: Dict, widths: List[int], formats: List[str], quality: Dict[str, int]) -> str:
+    """Fingerprint of everything besides the source bytes that shapes the output."""
+    settings = {
+        "dimensions": entry.get("dimensions"),
+        "widths": widths,
+        "formats": formats,
+        "quality": {fmt: quality[fmt] for fmt in formats},
+    }
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def is_up_to_date(entry: Dict, base_dir: Path, source_hash: str, settings: str) -> bool:
+    optimized = entry.get("optimized") or {}
+    if optimized.get("sourceSha256") != source_hash or optimized.get("settings") != settings:
+        return False
+    variants = optimized.get("variants") or []
+    return bool(variants) and all((base_dir / variant["path"]).exists() for variant in variants)
+
+
+def optimize_image(task: Dict) -> Dict:
+    """Resize one source image and write all format/width variants."""
+    base_dir = Path(task["baseDir"])
+    source = base_dir / task["path"]
+    target = task.get("dimensions") or {}
+    stem = Path(task["path"]).stem
+    output_dir = base_dir / OUTPUT_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    variants = []
+    with Image.open(source) as image:
+        image = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+        if target.get("width") and target.get("height"):
+            # Crop to the manifest aspect ratio, then scale to its size
+            image = ImageOps.fit(image, (target["width"], target["height"]), Image.LANCZOS)
+        base_width, base_height = image.size
+
+        widths = sorted({width for width in task["widths"] if width < base_width} | {base_width})
+        for width in widths:
+            height = round(base_height * width / base_width)
+            resized = image if width == base_width else image.resize((width, height), Image.LANCZOS)
+            for fmt in task["formats"]:
+                path = output_dir / f"{stem}-{width}w.{fmt}"
+                resized.save(path, fmt.upper(), quality=task["quality"][fmt])
+                variants.append({
+                    "format": fmt,
+                    "width": width,
+                    "height": height,
+                    "path": path.relative_to(base_dir).as_posix(),
+                    "bytes": path.stat().st_size,
+                })
+
+    return {"path": task["path"], "variants": variants}
+
+
+def save_manifest(manifest_path: Path, manifest: Dict):
+    tmp_path = manifest_path.with_suffix(manifest_path.suffix + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    os.replace(tmp_path, manifest_path)
+
+
+def optimize_manifest(manifest_path: Path, widths: List[int], formats: List[str],
+                      quality: Dict[str, int], workers: Optional[int] = None, force: bool = False) -> Dict:
+    """Optimize every manifest image in a process pool and update the manifest."""
+    base_dir = manifest_path.parent
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    formats = supported_formats(formats)
+    if not formats:
+        raise ValueError("None of the requested output formats can be encoded by this Pillow build")
+    entries = {entry["path"]: entry for entry in manifest_entries(manifest)}
+    tasks = []
+    skipped = 0
+    for path, entry in entries.items():
+        source = base_dir / path
+        if not source.exists():
+            print(f"⚠️  Missing source image: {path}", file=sys.stderr)
+            continue
+        source_hash = file_sha256(source)
+        settings = settings_key(entry, widths, formats, quality)
+        if not force and is_up_to_date(entry, base_dir, source_hash, settings):
+            skipped += 1
+            continue
+        tasks.append({
+            "baseDir": str(base_dir),
+            "path": path,
+            "sourceSha256": source_hash,
+            "settings": settings,
+            "dimensions": entry.get("dimensions"),
+            "widths": widths,
+            "formats": formats,
+            "quality": quality,
+        })
+
+    processed = 0
+    failed = []
+    if tasks:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(optimize_image, task): task for task in tasks}
+            for future in as_completed(futures):
+                task = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # Leave the previous record alone so the image is retried next run
+                    failed.append(task["path"])
+                    print(f"❌ {task['path']} failed: {e}", file=sys.stderr)
+                    continue
+                entries[task["path"]]["optimized"] = {
+                    "sourceSha256": task["sourceSha256"],
+                    "settings": task["settings"],
+                    "variants": result["variants"],
+                    "bytes": sum(variant["bytes"] for variant in result["variants"]),
+                }
+                processed += 1
+                # Persist each result so an aborted run keeps finished images
+                save_manifest(manifest_path, manifest)
+                print(f"✅ {task['path']} → {len(result['variants'])} variants")
+
+    manifest["optimization"] = {
+        "optimizedAt": datetime.now().isoformat(),
+        "widths": widths,
+        "formats": formats,
+        "processed": processed,
+        "skipped": skipped,
+        "failed": failed,
+    }
+    save_manifest(manifest_path, manifest)
+    return manifest
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def quality_value(value: str) -> int:
+    number = int(value)
+    if not 1 <= number <= 100:
+        raise argparse.ArgumentTypeError(f"must be between 1 and 100, got {value}")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resize and convert manifest images into responsive variants")
+    parser.add_argument("manifest", help="Path to image-manifest.json")
+    parser.add_argument("--widths", type=positive_int, nargs="+", default=DEFAULT_WIDTHS, help="Responsive widths")
+    parser.add_argument("--formats", nargs="+", default=DEFAULT_FORMATS, choices=sorted(DEFAULT_QUALITY),
+                        help="Output formats")
+    parser.add_argument("--quality", type=quality_value, help="Override encoder quality (1-100) for all formats")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    parser.add_argument("--force", action="store_true", help="Re-encode even if sources are unchanged")
+    args = parser.parse_args()
+
+    if Image is None:
+        print("❌ Pillow is required: pip install Pillow", file=sys.stderr)
+        sys.exit(1)
+
+    manifest_path = Path(args.manifest)
+    if not manifest_path.exists():
+        print(f"❌ Manifest not found: {manifest_path}", file=sys.stderr)
+        sys.exit(1)
+
+    quality = {fmt: DEFAULT_QUALITY[fmt] if args.quality is None else args.quality for fmt in DEFAULT_QUALITY}
+    try:
+        manifest = optimize_manifest(manifest_path, sorted(set(args.widths)), args.formats,
+                                     quality, args.workers, args.force)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+    stats = manifest["optimization"]
+    print(f"\n✅ {stats['processed']} optimized, {stats['skipped']} unchanged, "
+          f"{len(stats['failed'])} failed — manifest updated")
+    if stats["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Tests for optimize_images.py; skipped when Pillow is not installed."""
+
+import json
+
+import pytest
+
+pytest.importorskip("PIL")
+from PIL import Image  # noqa: E402
+
+import optimize_images  # noqa: E402
+from optimize_images import DEFAULT_QUALITY, optimize_manifest  # noqa: E402
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    (tmp_path / "images").mkdir()
+    for name in ("cover", "section-1"):
+        Image.new("RGB", (1344, 768), "navy").save(tmp_path / "images" / f"{name}.png")
+    manifest = {
+        "cover": {"path": "images/cover.png", "dimensions": {"width": 1200, "height": 675}},
+        "sections": [{"index": 1, "path": "images/section-1.png", "dimensions": {"width": 1200, "height": 675}}],
+    }
+    (tmp_path / "image-manifest.json").write_text(json.dumps(manifest))
+    return tmp_path
+
+
+def run(workspace, formats=("webp",)):
+    return optimize_manifest(workspace / "image-manifest.json", [480, 1200], list(formats), DEFAULT_QUALITY, workers=1)
+
+
+def test_variants_resized_and_recorded(workspace):
+    manifest = run(workspace)
+    variants = manifest["cover"]["optimized"]["variants"]
+    assert [(v["width"], v["height"]) for v in variants] == [(480, 270), (1200, 675)]
+    assert all((workspace / v["path"]).exists() for v in variants)
+    assert json.loads((workspace / "image-manifest.json").read_text())["cover"]["optimized"]["variants"] == variants
+
+
+def test_unchanged_images_are_skipped(workspace):
+    run(workspace)
+    stats = run(workspace)["optimization"]
+    assert stats["processed"] == 0
+    assert stats["skipped"] == 2
+
+
+def test_no_supported_format_is_an_error(workspace, monkeypatch):
+    monkeypatch.setattr(optimize_images.features, "check", lambda feature: False)
+    with pytest.raises(ValueError):
+        run(workspace, formats=("avif",))
+
+
+def test_failed_image_does_not_lose_finished_results(workspace):
+    (workspace / "images" / "section-1.png").write_bytes(b"not a png")
+    manifest = run(workspace)
+    assert manifest["optimization"]["failed"] == ["images/section-1.png"]
+    assert "optimized" not in manifest["sections"][0]
+    assert manifest["cover"]["optimized"]["variants"]
+
+
+@pytest.mark.parametrize("argv", [["--widths", "0"], ["--widths", "480", "-800"], ["--quality", "0"], ["--quality", "101"]])
+def test_invalid_widths_and_quality_are_rejected(argv, workspace, monkeypatch):
+    monkeypatch.setattr("sys.argv", ["optimize_images.py", str(workspace / "image-manifest.json"), *argv])
+    with pytest.raises(SystemExit) as exc:
+        optimize_images.main()
+    assert exc.value.code == 2
@@ -0,0 +1,504 @@
+#!/usr/bin/env python3
+"""
+Deterministic SEO and style metrics for blog drafts.
+
+Computes the measurable fields of seo-metadata.json (keyword density,
+keyword placement, header counts, readability, sentence length) and the
+brand-style structure limits from config/brand-style.json without a model
+round-trip. The markdown is tokenized once and every metric is derived
+from that single pass.
+
+Usage:
+    python analyze_content.py DRAFT.md --keyword "primary keyword"
+    python analyze_content.py --workspace blog-workspace --gate
+    python analyze_content.py --workspace blog-workspace --gate --tolerance 0.1
+"""
+
+import argparse
+import json
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+DEFAULT_BRAND_STYLE = REPO_ROOT / "config" / "brand-style.json"
+
+DRAFT_FILES = ["polished-draft.md", "seo-optimized-draft.md"]
+CONCLUSION_HEADINGS = re.compile(r"conclusion|final thoughts|wrapping up|key takeaways|the bottom line", re.I)
+
+WORD_RE = re.compile(r"\d+(?:[.,]\d+)*|[A-Za-z0-9]+(?:['’][A-Za-z]+)*")
+SENTENCE_END_RE = re.compile(r"(?<=[.!?])[\"')\]]*\s+")
+HEADER_RE = re.compile(r"^(#{1,6})\s+(.*)$")
+LIST_ITEM_RE = re.compile(r"^(?:[-*+]|\d+[.)])\s+")
+IMAGE_RE = re.compile(r"!\[([^\]]*)\]\(([^)]+)\)")
+LINK_RE = re.compile(r"(?<!!)\[([^\]]+)\]\(([^)]+)\)")
+INLINE_MARKUP_RE = re.compile(r"`[^`]*`|[*_~>#|]")
+VOWEL_GROUPS_RE = re.compile(r"[aeiouy]+")
+RANGE_RE = re.compile(r"(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)")
+RUBRIC_MAX_POINTS = 25
+
+
+def count_syllables(word: str) -> int:
+    """Approximate English syllable count from vowel groups."""
+    word = word.lower()
+    groups = len(VOWEL_GROUPS_RE.findall(word))
+    if word.endswith("e") and not word.endswith(("le", "ee")) and groups > 1:
+        groups -= 1
+    return max(groups, 1)
+
+
+def parse_range(value: str) -> Optional[Tuple[float, float]]:
+    """Parse brand-style ranges like '15-20 words average'."""
+    match = RANGE_RE.search(value or "")
+    if not match:
+        return None
+    return float(match.group(1)), float(match.group(2))
+
+
+def tokenize(text: str) -> List[str]:
+    return [token.lower() for token in WORD_RE.findall(text)]
+
+
+def phrase_positions(words: List[str], phrase: List[str]) -> List[int]:
+    """Word indexes where the phrase starts."""
+    if not phrase:
+        return []
+    size = len(phrase)
+    first = phrase[0]
+    return [
+        index for index, word in enumerate(words)
+        if word == first and words[index:index + size] == phrase
+    ]
+
+
+def contains_phrase(text: str, keyword: str) -> bool:
+    """Whole-word phrase match, so 'AI' does not match 'maintain'."""
+    return bool(phrase_positions(tokenize(text), tokenize(keyword)))
+
+
+def split_frontmatter(text: str) -> Tuple[Dict[str, str], str]:
+    """Split a leading YAML frontmatter block into flat key/value pairs."""
+    if not text.startswith("---"):
+        return {}, text
+    end = text.find("\n---", 3)
+    if end == -1:
+        return {}, text
+    meta = {}
+    for line in text[3:end].strip().splitlines():
+        if ":" in line:
+            key, value = line.split(":", 1)
+            meta[key.strip()] = value.strip().strip('"')
+    return meta, text[end + 4:]
+
+
+class Document:
+    """Single-pass tokenization of a markdown draft."""
+
+    def __init__(self, text: str):
+        self.frontmatter, body = split_frontmatter(text)
+        # Every word, including list items; prose stats below exclude lists
+        self.words: List[str] = []
+        self.sentence_lengths: List[int] = []
+        self.syllables = 0
+        self.headers: List[Tuple[int, str]] = []
+        self.paragraph_sentences: List[int] = []
+        # (heading, level, first word index) for each section start
+        self.sections: List[Tuple[str, int, int]] = [("", 0, 0)]
+        self.images: List[str] = []
+        self.links: List[str] = []
+
+        in_code = False
+        paragraph: List[str] = []
+        for line in body.splitlines():
+            stripped = line.strip()
+            if stripped.startswith("```"):
+                in_code = not in_code
+                self._flush(paragraph)
+                continue
+            if in_code:
+                continue
+            header = HEADER_RE.match(stripped)
+            if header:
+                self._flush(paragraph)
+                level, heading = len(header.group(1)), header.group(2).strip()
+                self.headers.append((level, heading))
+                self.sections.append((heading, level, len(self.words)))
+                continue
+            if not stripped or stripped == "---" or stripped.startswith("|"):
+                self._flush(paragraph)
+                continue
+            if LIST_ITEM_RE.match(stripped):
+                self._flush(paragraph)
+                self._flush([LIST_ITEM_RE.sub("", stripped)], prose=False)
+                continue
+            paragraph.append(stripped)
+        self._flush(paragraph)
+
+    def _flush(self, lines: List[str], prose: bool = True):
+        """Tokenize a block; list items count toward words but not sentence/paragraph stats."""
+        if not lines:
+            return
+        text = " ".join(lines)
+        lines.clear()
+        self.images.extend(alt for alt, _ in IMAGE_RE.findall(text))
+        text = IMAGE_RE.sub(" ", text)
+        self.links.extend(url for _, url in LINK_RE.findall(text))
+        text = INLINE_MARKUP_RE.sub(" ", LINK_RE.sub(r"\1", text))
+
+        if not prose:
+            self.words.extend(token.lower() for token in WORD_RE.findall(text))
+            return
+
+        sentences = 0
+        for sentence in SENTENCE_END_RE.split(text):
+            tokens = WORD_RE.findall(sentence)
+            if not tokens:
+                continue
+            sentences += 1
+            self.sentence_lengths.append(len(tokens))
+            self.syllables += sum(count_syllables(token) for token in tokens)
+            self.words.extend(token.lower() for token in tokens)
+        if sentences:
+            self.paragraph_sentences.append(sentences)
+
+    def section_word_counts(self, level: int = 2) -> List[Tuple[str, int]]:
+        """Word counts for sections starting at the given header level."""
+        starts = [(heading, index) for heading, lvl, index in self.sections if lvl == level]
+        counts = []
+        for position, (heading, start) in enumerate(starts):
+            end = starts[position + 1][1] if position + 1 < len(starts) else len(self.words)
+            counts.append((heading, end - start))
+        return counts
+
+    @property
+    def title(self) -> str:
+        return self.frontmatter.get("title") or next((text for level, text in self.headers if level == 1), "")
+
+    def header_hierarchy_ok(self) -> bool:
+        """Headers start at H1 and never skip a level on the way down."""
+        previous = 0
+        for level, _ in self.headers:
+            if level > previous + 1:
+                return False
+            previous = level
+        return bool(self.headers)
+
+    def keyword_positions(self, keyword: str) -> List[int]:
+        """Word indexes where the keyword phrase starts."""
+        return phrase_positions(self.words, tokenize(keyword))
+
+
+def keyword_distribution(positions: List[int], total_words: int, buckets: int = 4) -> str:
+    """Classify keyword spread across equal slices of the text."""
+    if not positions or not total_words:
+        return "none"
+    hits = [0] * buckets
+    for position in positions:
+        hits[min(position * buckets // total_words, buckets - 1)] += 1
+    if all(hits):
+        return "even"
+    if hits[0] and not any(hits[buckets // 2:]):
+        return "front-loaded"
+    if hits[-1] and not any(hits[:buckets // 2]):
+        return "back-loaded"
+    return "uneven"
+
+
+def flesch_scores(words: int, sentences: int, syllables: int) -> Tuple[float, float]:
+    """Flesch reading ease and Flesch-Kincaid grade level."""
+    if not words or not sentences:
+        return 0.0, 0.0
+    words_per_sentence = words / sentences
+    syllables_per_word = syllables / words
+    ease = 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+    grade = 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59
+    return round(ease, 1), round(grade, 1)
+
+
+def in_range(value: float, bounds: Optional[Tuple[float, float]]) -> bool:
+    return bounds is None or bounds[0] <= value <= bounds[1]
+
+
+def widen(bounds: Optional[Tuple[float, float]], tolerance: float) -> Optional[Tuple[float, float]]:
+    if bounds is None:
+        return None
+    return round(bounds[0] * (1 - tolerance), 2), round(bounds[1] * (1 + tolerance), 2)
+
+
+def range_check(value: float, limit: Optional[str], tolerance: float = 0.0) -> Dict:
+    """Strict brand-style range result plus the bounds used for gating.
+
+    The gate uses the exact brand-style range unless a relative tolerance is
+    given (e.g. 0.1 widens 15-20 to 13.5-22).
+    """
+    bounds = parse_range(limit or "")
+    gate_bounds = widen(bounds, tolerance)
+    return {
+        "value": value,
+        "limit": limit,
+        "inRange": in_range(value, bounds),
+        "gateRange": list(gate_bounds) if gate_bounds else None,
+        "pass": in_range(value, gate_bounds),
+    }
+
+
+def score_rubric(metrics: Dict, doc: Document, has_keyword: bool) -> Dict:
+    """Points for the measurable items of the documented SEO rubric.
+
+    Items that need judgement (LSI usage, content flow, schema, user value)
+    are left to the model and excluded from `measured`.
+    """
+    content, headers, images = metrics["content"], metrics["headers"], metrics["images"]
+    density = metrics["keywords"]["density"]["primary"]
+    description = doc.frontmatter.get("description", "")
+    slug = doc.frontmatter.get("slug", "")
+    keyword_items = [
+        (5, contains_phrase(doc.title, metrics["keywords"]["primary"])),
+        (5, 1.0 <= density <= 2.0),
+        (5, headers["keywordInHeaders"]),
+        (5, content["keywordInFirst100Words"] and content["keywordInLast100Words"]),
+    ] if has_keyword else []
+    categories = {
+        "keywordOptimization": keyword_items,
+        "contentStructure": [
+            (5, headers["h1Count"] == 1),
+            (5, doc.header_hierarchy_ok()),
+            (5, metrics["readability"]["paragraphLength"] <= 4),
+        ],
+        "technicalSeo": [
+            (5, images["withAltText"] == images["total"]),
+            (5, metrics["links"]["internalLinks"] + metrics["links"]["externalLinks"] > 0),
+        ] + ([(5, 150 <= len(description) <= 160)] if description else [])
+          + ([(5, bool(re.fullmatch(r"[a-z0-9]+(?:-[a-z0-9]+)*", slug)))] if slug else []),
+        "userValue": [],
+    }
+    return {
+        name: {
+            "earned": sum(points for points, passed in items if passed),
+            "measured": sum(points for points, _ in items),
+            "max": RUBRIC_MAX_POINTS,
+        }
+        for name, items in categories.items()
+    }
+
+
+def build_gate(metrics: Dict, doc: Document, brand_style: Dict, has_keyword: bool,
+               tolerance: float = 0.0) -> Dict:
+    """Per-metric gate checks; a draft that fails any of these is not worth a model review yet."""
+    seo_prefs = brand_style.get("seoPreferences", {})
+    content, headers, images = metrics["content"], metrics["headers"], metrics["images"]
+    seo = {
+        "singleH1": {"value": headers["h1Count"], "pass": headers["h1Count"] == 1},
+        "imageAltText": {"value": images["withAltText"], "pass": images["withAltText"] == images["total"]},
+    }
+    if has_keyword:
+        seo["keywordInTitle"] = {"pass": contains_phrase(doc.title, metrics["keywords"]["primary"])}
+        seo["keywordInHeaders"] = {"pass": headers["keywordInHeaders"]}
+        seo["keywordInFirst100Words"] = {"pass": content["keywordInFirst100Words"]}
+        seo["keywordDensity"] = range_check(metrics["keywords"]["density"]["primary"],
+                                            seo_prefs.get("keywordDensity"), tolerance)
+    description = doc.frontmatter.get("description")
+    if description:
+        seo["metaDescriptionLength"] = range_check(len(description), seo_prefs.get("metaDescriptionLength"),
+                                                   tolerance)
+    style = {name: check for name, check in metrics["structure"].items() if name != "sectionLength"}
+    return {"seo": seo, "style": style}
+
+
+def analyze(text: str, primary: str, secondary: Optional[List[str]] = None,
+            brand_style: Optional[Dict] = None, tolerance: float = 0.0) -> Dict:
+    """Compute SEO metrics and brand-style structure checks for a draft."""
+    doc = Document(text)
+    brand_style = brand_style or {}
+    total = len(doc.words)
+    sentences = len(doc.sentence_lengths)
+
+    primary_positions = doc.keyword_positions(primary)
+    phrase_len = max(len(WORD_RE.findall(primary)), 1)
+    tail_start = max(total - 100, 0)
+
+    def density(positions: List[int], size: int) -> float:
+        return round(100 * len(positions) * size / total, 2) if total else 0.0
+
+    secondary_density = {
+        keyword: density(doc.keyword_positions(keyword), max(len(WORD_RE.findall(keyword)), 1))
+        for keyword in secondary or []
+    }
+    header_counts = {level: 0 for level in (1, 2, 3)}
+    for level, _ in doc.headers:
+        if level in header_counts:
+            header_counts[level] += 1
+    has_keyword = bool(tokenize(primary))
+    external = sum(1 for url in doc.links if url.startswith(("http://", "https://")))
+
+    prose_words = sum(doc.sentence_lengths)
+    ease, grade = flesch_scores(prose_words, sentences, doc.syllables)
+    avg_sentence = round(prose_words / sentences, 1) if sentences else 0.0
+    avg_paragraph = (round(sum(doc.paragraph_sentences) / len(doc.paragraph_sentences), 1)
+                     if doc.paragraph_sentences else 0.0)
+
+    metrics = {
+        "keywords": {
+            "primary": primary,
+            "secondary": list(secondary or []),
+            "occurrences": len(primary_positions),
+            "density": {"primary": density(primary_positions, phrase_len), "secondary": secondary_density},
+        },
+        "headers": {
+            "h1Count": header_counts[1],
+            "h2Count": header_counts[2],
+            "h3Count": header_counts[3],
+            "keywordInHeaders": has_keyword and any(contains_phrase(heading, primary) for _, heading in doc.headers),
+        },
+        "content": {
+            "wordCount": total,
+            "keywordInFirst100Words": any(position < 100 for position in primary_positions),
+            "keywordInLast100Words": any(position >= tail_start for position in primary_positions),
+            "keywordDistribution": keyword_distribution(primary_positions, total),
+        },
+        "links": {
+            "internalLinks": len(doc.links) - external,
+            "externalLinks": external,
+        },
+        "images": {
+            "total": len(doc.images),
+            "withAltText": sum(1 for alt in doc.images if alt.strip()),
+        },
+        "readability": {
+            "score": ease,
+            "gradeLevel": grade,
+            "avgSentenceLength": avg_sentence,
+            "paragraphLength": avg_paragraph,
+        },
+    }
+
+    limits = brand_style.get("writingStyle", {}).get("structure", {})
+    sections = doc.section_word_counts(2)
+    # Introduction is everything before the first H2
+    intro_words = next((index for _, level, index in doc.sections if level == 2), total)
+    conclusion = next((count for heading, count in reversed(sections) if CONCLUSION_HEADINGS.search(heading)),
+                      sections[-1][1] if sections else 0)
+
+    structure = {
+        name: range_check(value, limits.get(name), tolerance)
+        for name, value in (("sentenceLength", avg_sentence), ("paragraphLength", avg_paragraph),
+                            ("introductionLength", intro_words), ("conclusionLength", conclusion))
+    }
+    section_range = parse_range(limits.get("sectionLength", ""))
+    if section_range:
+        outside = [heading for heading, count in sections if not in_range(count, section_range)]
+        structure["sectionLength"] = {
+            "value": len(sections) - len(outside),
+            "limit": limits.get("sectionLength"),
+            "outOfRange": outside,
+            "inRange": not outside,
+        }
+
+    metrics["structure"] = structure
+    metrics["seoRubric"] = score_rubric(metrics, doc, has_keyword)
+    metrics["gate"] = build_gate(metrics, doc, brand_style, has_keyword, tolerance)
+    return metrics
+
+
+def check_thresholds(metrics: Dict) -> Dict[str, bool]:
+    """Whether every SEO and style gate check passed."""
+    return {
+        group: all(check["pass"] for check in checks.values())
+        for group, checks in metrics["gate"].items()
+    }
+
+
+def load_brand_style(path: Path = DEFAULT_BRAND_STYLE) -> Dict:
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def find_drafts(workspace: Path) -> List[Path]:
+    """Find the most-processed draft in every project directory under a workspace."""
+    drafts = []
+    for directory in sorted({path.parent for path in workspace.rglob("*.md")}):
+        for name in DRAFT_FILES:
+            candidate = directory / name
+            if candidate.exists():
+                drafts.append(candidate)
+                break
+    return drafts
+
+
+def project_keywords(draft: Path) -> Tuple[str, List[str]]:
+    """Read target keywords from the project's seo-metadata.json."""
+    metadata_file = draft.parent / "seo-metadata.json"
+    if not metadata_file.exists():
+        return "", []
+    with open(metadata_file, "r", encoding="utf-8") as f:
+        keywords = json.load(f).get("seo", {}).get("keywords", {})
+    return keywords.get("primary", ""), keywords.get("secondary", [])
+
+
+def analyze_file(draft: Path, primary: str = "", secondary: Optional[List[str]] = None,
+                 brand_style: Optional[Dict] = None, tolerance: float = 0.0) -> Dict:
+    if not primary:
+        primary, secondary = project_keywords(draft)
+    if brand_style is None:
+        brand_style = load_brand_style()
+    text = draft.read_text(encoding="utf-8")
+    metrics = analyze(text, primary, secondary, brand_style, tolerance)
+    metrics["file"] = str(draft)
+    metrics["passes"] = check_thresholds(metrics)
+    return metrics
+
+
+def _analyze_task(args: Tuple[Path, Dict, float]) -> Dict:
+    draft, brand_style, tolerance = args
+    return analyze_file(draft, brand_style=brand_style, tolerance=tolerance)
+
+
+def analyze_workspace(workspace: Path, brand_style: Dict, workers: Optional[int] = None,
+                      tolerance: float = 0.0) -> List[Dict]:
+    """Score every project draft in a workspace in parallel."""
+    drafts = find_drafts(workspace)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_analyze_task, [(draft, brand_style, tolerance) for draft in drafts]))
+
+
+def non_negative_float(value: str) -> float:
+    number = float(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0, got {value}")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Deterministic SEO and style scoring for blog drafts")
+    parser.add_argument("draft", nargs="?", help="Markdown draft to analyze")
+    parser.add_argument("--keyword", default="", help="Primary keyword (default: from seo-metadata.json)")
+    parser.add_argument("--secondary", nargs="*", default=None, help="Secondary keywords")
+    parser.add_argument("--workspace", help="Score every project draft under this directory")
+    parser.add_argument("--brand-style", default=str(DEFAULT_BRAND_STYLE), help="Path to brand-style.json")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for --workspace")
+    parser.add_argument("--gate", action="store_true", help="Exit 1 if any draft fails a gate check")
+    parser.add_argument("--tolerance", type=non_negative_float, default=0.0,
+                        help="Relative slack around brand-style ranges for gate checks, e.g. 0.1 (default: exact ranges)")
+    args = parser.parse_args()
+
+    if not args.draft and not args.workspace:
+        parser.error("provide a draft file or --workspace")
+
+    brand_style = load_brand_style(Path(args.brand_style))
+    if args.workspace:
+        results = analyze_workspace(Path(args.workspace), brand_style, args.workers, args.tolerance)
+    else:
+        results = [analyze_file(Path(args.draft), args.keyword, args.secondary, brand_style, args.tolerance)]
+
+    print(json.dumps(results if args.workspace else results[0], indent=2))
+
+    if args.gate and not all(all(result["passes"].values()) for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
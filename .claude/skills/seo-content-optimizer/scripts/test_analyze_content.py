@@ -0,0 +1,164 @@
+"""Tests for analyze_content.py metrics on fixed markdown snippets."""
+
+import pytest
+
+from analyze_content import Document, analyze, check_thresholds, load_brand_style
+
+FILLER = ["teams", "ship", "agents", "with", "less", "context", "and", "lower", "cost", "every", "day"]
+
+DRAFT = """---
+title: "Docker MCP Explained"
+description: "Docker MCP explained."
+---
+
+# Docker MCP Explained
+
+Docker MCP loads tools on demand. It saves tokens for every session.
+
+## Why Docker MCP Matters
+
+Teams pay for context they never use. That changes now.
+
+- first item without punctuation
+- second item without punctuation
+- third item
+- fourth item
+
+```python
+ignored = "code words do not count"
+```
+
+### Setup Details
+
+Install it once. Point your agent at the gateway and you are done.
+"""
+
+
+@pytest.fixture
+def brand_style():
+    return load_brand_style()
+
+
+def test_list_items_are_not_sentences():
+    doc = Document(DRAFT)
+    # Prose only: 3 paragraphs of 2 sentences each, lists excluded
+    assert doc.sentence_lengths == [6, 6, 7, 3, 3, 10]
+    assert doc.paragraph_sentences == [2, 2, 2]
+
+
+def test_list_words_still_count_toward_word_count():
+    doc = Document(DRAFT)
+    assert len(doc.words) == sum(doc.sentence_lengths) + 12
+
+
+def test_code_blocks_are_ignored():
+    doc = Document(DRAFT)
+    assert "ignored" not in doc.words
+
+
+def test_numbers_are_single_words():
+    doc = Document("Costs rose to $3.00 for 150,000 tokens.")
+    assert doc.sentence_lengths == [7]
+
+
+def test_header_counts_and_keyword_placement(brand_style):
+    metrics = analyze(DRAFT, "Docker MCP", brand_style=brand_style)
+    assert metrics["headers"] == {"h1Count": 1, "h2Count": 1, "h3Count": 1, "keywordInHeaders": True}
+    assert metrics["keywords"]["occurrences"] == 1
+    assert metrics["content"]["keywordInFirst100Words"] is True
+    assert metrics["readability"]["avgSentenceLength"] == 5.8
+    assert metrics["readability"]["paragraphLength"] == 2.0
+
+
+def test_keyword_density():
+    metrics = analyze("Alpha beta gamma delta. Alpha beta again here.", "alpha beta")
+    # 2 occurrences x 2 words over 8 words
+    assert metrics["keywords"]["density"]["primary"] == 50.0
+
+
+def test_empty_keyword_skips_keyword_checks(brand_style):
+    metrics = analyze(DRAFT, "", brand_style=brand_style)
+    assert metrics["headers"]["keywordInHeaders"] is False
+    assert metrics["seoRubric"]["keywordOptimization"]["measured"] == 0
+    assert "keywordInHeaders" not in metrics["gate"]["seo"]
+    assert "keywordDensity" not in metrics["gate"]["seo"]
+
+
+def test_meta_description_gate(brand_style):
+    metrics = analyze(DRAFT, "Docker MCP", brand_style=brand_style)
+    check = metrics["gate"]["seo"]["metaDescriptionLength"]
+    assert check["value"] == len("Docker MCP explained.")
+    assert check["pass"] is False
+    assert check_thresholds(metrics)["seo"] is False
+
+
+def build_draft(words: int = 18, sentences: int = 3, paragraphs: int = 3, description: int = 155) -> str:
+    """Three sections (intro, body, conclusion) of identical paragraphs; keyword once per section."""
+    def sentence(keyword: bool) -> str:
+        tokens = ["Docker", "MCP"] if keyword else []
+        tokens += [FILLER[i % len(FILLER)] for i in range(words - len(tokens))]
+        return " ".join(tokens).capitalize() + "."
+
+    def section() -> str:
+        return "\n\n".join(
+            " ".join(sentence(p == 0 and s == 0) for s in range(sentences)) for p in range(paragraphs)
+        )
+
+    return (f'---\ntitle: "Docker MCP Gateway Guide"\ndescription: "{"x" * description}"\n---\n\n'
+            f"# Docker MCP Gateway Guide\n\n{section()}\n\n"
+            f"## Running Docker MCP\n\n{section()}\n\n"
+            f"## Conclusion\n\n{section()}\n")
+
+
+def failing_checks(metrics):
+    return sorted(name for checks in metrics["gate"].values() for name, check in checks.items() if not check["pass"])
+
+
+@pytest.mark.parametrize("layout", [
+    {},
+    {"words": 20},                              # sentence length at upper bound
+    {"words": 15, "sentences": 4},              # sentence lower, paragraph upper bound
+    {"description": 150},
+    {"description": 160},
+], ids=str)
+def test_draft_inside_brand_style_bounds_passes_gate(layout, brand_style):
+    metrics = analyze(build_draft(**layout), "Docker MCP", brand_style=brand_style)
+    assert failing_checks(metrics) == []
+
+
+@pytest.mark.parametrize("layout, failing", [
+    ({"words": 21}, ["sentenceLength"]),
+    ({"words": 14, "sentences": 4}, ["sentenceLength"]),
+    ({"words": 18, "sentences": 2, "paragraphs": 5}, ["paragraphLength"]),
+    ({"description": 149}, ["metaDescriptionLength"]),
+    ({"description": 161}, ["metaDescriptionLength"]),
+], ids=str)
+def test_draft_just_outside_brand_style_bounds_fails_gate(layout, failing, brand_style):
+    metrics = analyze(build_draft(**layout), "Docker MCP", brand_style=brand_style)
+    assert failing_checks(metrics) == failing
+
+
+def test_style_ranges_report_strict_and_gate_bounds(brand_style):
+    metrics = analyze(DRAFT, "Docker MCP", brand_style=brand_style)
+    sentence = metrics["structure"]["sentenceLength"]
+    assert sentence["inRange"] is False
+    assert sentence["gateRange"] == [15.0, 20.0]
+
+
+def test_tolerance_widens_gate_but_not_in_range(brand_style):
+    metrics = analyze(build_draft(words=21), "Docker MCP", brand_style=brand_style, tolerance=0.1)
+    sentence = metrics["structure"]["sentenceLength"]
+    assert sentence["gateRange"] == [13.5, 22.0]
+    assert sentence["inRange"] is False
+    assert sentence["pass"] is True
+
+
+def test_keyword_matches_whole_words_only():
+    text = "---\ntitle: Maintain Detailed Pipelines\n---\n\n# Maintain Detailed Pipelines\n\n## Detailed Setup\n\nAI helps."
+    metrics = analyze(text, "AI")
+    assert metrics["headers"]["keywordInHeaders"] is False
+    assert metrics["gate"]["seo"]["keywordInTitle"]["pass"] is False
+    # Only the first/last 100 words item is earned
+    assert metrics["seoRubric"]["keywordOptimization"]["earned"] == 5
+    metrics = analyze(text.replace("Detailed Setup", "AI Setup"), "ai")
+    assert metrics["headers"]["keywordInHeaders"] is True
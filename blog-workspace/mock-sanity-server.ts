@@ -0,0 +1,63 @@
+// Minimal local stand-in for the Sanity asset and query APIs used by
+// upload-images-to-sanity.ts. Run it, then point the uploader at it:
+//
+//   bun mock-sanity-server.ts
+//   SANITY_API_HOST=http://localhost:4000 SANITY_TOKEN=mock bun upload-images-to-sanity.ts
+//
+// MOCK_FAIL_UPLOADS=N answers the first N uploads with 503 to exercise retries;
+// MOCK_REJECT_TOKEN=1 answers every request with 401 to check fail-fast.
+import { createHash } from "crypto";
+import { createServer } from "http";
+
+const PORT = Number(process.env.MOCK_PORT || 4000);
+let failUploads = Number(process.env.MOCK_FAIL_UPLOADS || 0);
+const rejectToken = process.env.MOCK_REJECT_TOKEN === "1";
+
+// sha1 -> stored asset document, mirroring Sanity's hash-based asset ids
+const assets = new Map();
+let uploadRequests = 0;
+
+function send(res, status, body) {
+  res.writeHead(status, { "Content-Type": "application/json" });
+  res.end(JSON.stringify(body));
+}
+
+const server = createServer((req, res) => {
+  const url = new URL(req.url, `http://localhost:${PORT}`);
+
+  if (rejectToken) return send(res, 401, { error: "Unauthorized", message: "Invalid token" });
+
+  // GROQ lookup by sha1hash: GET /v<api>/data/query/<dataset>?query=...&$sha1="..."
+  if (req.method === "GET" && url.pathname.includes("/data/query/")) {
+    const sha1 = JSON.parse(url.searchParams.get("$sha1") || "null");
+    const asset = assets.get(sha1);
+    return send(res, 200, { result: asset ? { _id: asset._id, url: asset.url } : null });
+  }
+
+  // Asset upload: POST /v<api>/assets/images/<dataset>
+  if (req.method === "POST" && url.pathname.includes("/assets/images/")) {
+    uploadRequests++;
+    const chunks = [];
+    req.on("data", (chunk) => chunks.push(chunk));
+    req.on("end", () => {
+      if (failUploads > 0) {
+        failUploads--;
+        console.log(`503 upload #${uploadRequests} (injected failure)`);
+        return send(res, 503, { error: "Service Unavailable" });
+      }
+      const body = Buffer.concat(chunks);
+      const sha1 = createHash("sha1").update(body).digest("hex");
+      const ext = (url.searchParams.get("filename") || "image.png").split(".").pop();
+      const _id = `image-${sha1}-1200x675-${ext}`;
+      const document = { _id, sha1hash: sha1, url: `http://localhost:${PORT}/images/${sha1}.${ext}`, size: body.length };
+      assets.set(sha1, document);
+      console.log(`200 upload #${uploadRequests} ${url.searchParams.get("filename")} (${body.length} bytes) -> ${_id}`);
+      send(res, 200, { document });
+    });
+    return;
+  }
+
+  send(res, 404, { error: "Not Found", path: url.pathname });
+});
+
+server.listen(PORT, () => console.log(`🧪 Mock Sanity API listening on http://localhost:${PORT}`));
@@ -1,13 +1,23 @@
 import { createClient } from "@sanity/client";
-import { readFileSync, writeFileSync } from "fs";
-import { basename } from "path";
+import { createHash } from "crypto";
+import { createReadStream, existsSync, readFileSync, renameSync, writeFileSync } from "fs";
+
+const MANIFEST_PATH = "sanity-assets.json";
+const IMAGE_MANIFEST_PATH = "image-manifest.json";
+const PREFERRED_FORMAT = process.env.UPLOAD_FORMAT || "webp";
+const CONTENT_TYPES: Record<string, string> = { png: "image/png", webp: "image/webp", avif: "image/avif" };
+const CONCURRENCY = Number(process.env.UPLOAD_CONCURRENCY || 3);
+const MAX_ATTEMPTS = Number(process.env.UPLOAD_MAX_ATTEMPTS || 3);
+const RETRY_BASE_MS = 1000;
 
 const client = createClient({
-  projectId: "w486ji4p",
-  dataset: "production",
+  projectId: process.env.SANITY_PROJECT_ID || "w486ji4p",
+  dataset: process.env.SANITY_DATASET || "production",
   apiVersion: "2024-01-01",
   token: process.env.SANITY_TOKEN,
   useCdn: false,
+  // Point at a local mock server when testing, e.g. http://localhost:4000
+  ...(process.env.SANITY_API_HOST ? { apiHost: process.env.SANITY_API_HOST, useProjectHostname: false } : {}),
 });
 
 const images = [
@@ -20,13 +30,104 @@ const images = [
   { path: "images/section-6.png", name: "docker-mcp-performance", alt: "Performance dashboard displaying token reduction, speed improvements, and cost savings" },
 ];
 
-async function uploadImage(imagePath: string, filename: string): Promise<any> {
-  const buffer = readFileSync(imagePath);
-  const asset = await client.assets.upload("image", buffer, {
-    filename: `${filename}.png`,
-    contentType: "image/png",
+type UploadFile = { path: string; ext: string; contentType: string };
+type Variant = { format: string; width: number; path: string };
+
+// Largest optimized variant per source path, from the optimize_images.py stage
+function loadOptimizedVariants(): Map<string, Variant> {
+  const variants = new Map<string, Variant>();
+  if (!existsSync(IMAGE_MANIFEST_PATH)) return variants;
+  const imageManifest = JSON.parse(readFileSync(IMAGE_MANIFEST_PATH, "utf-8"));
+  const entries = [imageManifest.cover, ...(imageManifest.sections || [])].filter(Boolean);
+  for (const entry of entries) {
+    const candidates: Variant[] = (entry.optimized?.variants || []).filter((v: Variant) => v.format === PREFERRED_FORMAT);
+    const largest = candidates.sort((a, b) => b.width - a.width)[0];
+    if (largest) variants.set(entry.path, largest);
+  }
+  return variants;
+}
+
+function resolveUploadFile(imagePath: string, variants: Map<string, Variant>): UploadFile {
+  const variant = variants.get(imagePath);
+  if (variant && existsSync(variant.path)) {
+    return { path: variant.path, ext: variant.format, contentType: CONTENT_TYPES[variant.format] };
+  }
+  return { path: imagePath, ext: "png", contentType: CONTENT_TYPES.png };
+}
+
+type ManifestEntry = { _id: string; url: string; alt: string; sha1?: string };
+type Manifest = Record<string, ManifestEntry>;
+
+function loadManifest(): Manifest {
+  if (!existsSync(MANIFEST_PATH)) return {};
+  return JSON.parse(readFileSync(MANIFEST_PATH, "utf-8"));
+}
+
+// Write-then-rename so an interrupted run never leaves a truncated manifest
+function saveManifest(manifest: Manifest) {
+  const tmpPath = `${MANIFEST_PATH}.tmp`;
+  writeFileSync(tmpPath, JSON.stringify(manifest, null, 2));
+  renameSync(tmpPath, MANIFEST_PATH);
+}
+
+// Sanity asset ids embed the SHA-1 of the file: image-<sha1>-<w>x<h>-<ext>
+function sha1FromAssetId(assetId?: string): string | undefined {
+  return typeof assetId === "string" ? assetId.split("-")[1] : undefined;
+}
+
+function hashFile(path: string): Promise<string> {
+  return new Promise((resolve, reject) => {
+    const hash = createHash("sha1");
+    createReadStream(path)
+      .on("data", (chunk) => hash.update(chunk))
+      .on("end", () => resolve(hash.digest("hex")))
+      .on("error", reject);
+  });
+}
+
+// Network errors carry no status code; only those, 429 and 5xx are worth retrying
+function isRetryable(error: any): boolean {
+  const status = error?.statusCode ?? error?.response?.statusCode;
+  return status === undefined || status === 429 || status >= 500;
+}
+
+async function withRetry<T>(label: string, fn: () => Promise<T>): Promise<T> {
+  for (let attempt = 1; ; attempt++) {
+    try {
+      return await fn();
+    } catch (error: any) {
+      if (attempt >= MAX_ATTEMPTS || !isRetryable(error)) throw error;
+      const delay = RETRY_BASE_MS * 2 ** (attempt - 1);
+      console.warn(`   ⚠️  ${label} failed (attempt ${attempt}/${MAX_ATTEMPTS}): ${error.message} - retrying in ${delay}ms`);
+      await new Promise((resolve) => setTimeout(resolve, delay));
+    }
+  }
+}
+
+async function findExistingAsset(sha1: string): Promise<{ _id: string; url: string } | null> {
+  return withRetry(`lookup ${sha1.substring(0, 12)}`, () =>
+    client.fetch(`*[_type == "sanity.imageAsset" && sha1hash == $sha1][0]{_id, url}`, { sha1 })
+  );
+}
+
+async function uploadImage(file: UploadFile, filename: string): Promise<any> {
+  // Re-open the stream on every attempt; a consumed stream cannot be replayed
+  return withRetry(filename, () =>
+    client.assets.upload("image", createReadStream(file.path), {
+      filename: `${filename}.${file.ext}`,
+      contentType: file.contentType,
+    })
+  );
+}
+
+async function runPool<T>(items: T[], limit: number, worker: (item: T) => Promise<void>) {
+  let next = 0;
+  const runners = Array.from({ length: Math.min(limit, items.length) }, async () => {
+    while (next < items.length) {
+      await worker(items[next++]);
+    }
   });
-  return asset;
+  await Promise.all(runners);
 }
 
 async function main() {
@@ -36,34 +137,58 @@ async function main() {
     process.exit(1);
   }
 
-  console.log("🚀 Uploading images to Sanity...\n");
+  console.log(`🚀 Uploading images to Sanity (concurrency ${CONCURRENCY})...\n`);
 
-  const results: Record<string, any> = {};
+  const manifest = loadManifest();
+  const variants = loadOptimizedVariants();
+  const knownHashes = new Map<string, ManifestEntry>();
+  for (const entry of Object.values(manifest)) {
+    // Hand-edited or partial entries may lack an _id; they simply aren't dedup candidates
+    const sha1 = entry?.sha1 || sha1FromAssetId(entry?._id);
+    if (sha1) knownHashes.set(sha1, entry);
+  }
 
-  for (const img of images) {
+  let uploaded = 0;
+  let skipped = 0;
+  let failed = 0;
+
+  await runPool(images, CONCURRENCY, async (img) => {
     try {
-      console.log(`📤 Uploading ${img.path}...`);
-      const asset = await uploadImage(img.path, img.name);
-      results[img.name] = {
-        _id: asset._id,
-        url: asset.url,
-        alt: img.alt,
-      };
+      const file = resolveUploadFile(img.path, variants);
+      const sha1 = await hashFile(file.path);
+
+      const known = knownHashes.get(sha1) || (await findExistingAsset(sha1));
+      if (known) {
+        manifest[img.name] = { _id: known._id, url: known.url, alt: img.alt, sha1 };
+        saveManifest(manifest);
+        skipped++;
+        console.log(`⏭️  ${file.path} unchanged (${known._id})`);
+        return;
+      }
+
+      console.log(`📤 Uploading ${file.path}...`);
+      const asset = await uploadImage(file, img.name);
+      const entry = { _id: asset._id, url: asset.url, alt: img.alt, sha1 };
+      manifest[img.name] = entry;
+      knownHashes.set(sha1, entry);
+      saveManifest(manifest);
+      uploaded++;
       console.log(`   ✅ ${asset._id}`);
     } catch (error: any) {
-      console.error(`   ❌ Failed: ${error.message}`);
+      failed++;
+      console.error(`   ❌ ${img.path} failed: ${error.message}`);
     }
-  }
+  });
 
-  // Save asset manifest
-  writeFileSync("sanity-assets.json", JSON.stringify(results, null, 2));
-  console.log("\n✅ Asset manifest saved to sanity-assets.json");
+  console.log(`\n✅ Asset manifest saved to ${MANIFEST_PATH} (${uploaded} uploaded, ${skipped} skipped, ${failed} failed)`);
   console.log("\nUploaded assets:");
-  console.table(Object.entries(results).map(([name, data]) => ({
+  console.table(Object.entries(manifest).map(([name, data]) => ({
     name,
     id: data._id,
     url: data.url?.substring(0, 60) + "...",
   })));
+
+  if (failed > 0) process.exit(1);
 }
 
 main().catch(console.error);